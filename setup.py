@@ -9,7 +9,8 @@ setup(
   url = 'https://github.com/caroso1222/wapy',
   download_url = 'https://github.com/caroso1222/wapy/tarball/0.1.0',
   keywords = ['walmart', 'wrapper', 'walmart api', 'api', 'python client', 'python'],
-  install_requires=["requests"],
+  install_requires=["requests", "urllib3>=1.26"],
+  python_requires=">=3.8",
   classifiers=[
           "Development Status :: 5 - Production/Stable",
           "Environment :: Console",
@@ -17,10 +18,8 @@ setup(
           "Natural Language :: English",
           "Operating System :: OS Independent",
           "Programming Language :: Python",
-          "Programming Language :: Python :: 2.7",
-          "Programming Language :: Python :: 3.3",
-          "Programming Language :: Python :: 3.4",
-          "Programming Language :: Python :: 3.5",
+          "Programming Language :: Python :: 3",
+          "Programming Language :: Python :: 3 :: Only",
           "Topic :: Software Development :: Libraries :: Python Modules",
           "Topic :: Internet :: WWW/HTTP :: Dynamic Content :: CGI Tools/Libraries",
           "Topic :: Utilities",
@@ -1,14 +1,80 @@
+import concurrent.futures
+from functools import cached_property, lru_cache
+from html import unescape as _html_unescape
+import time
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 try:
-    # Python 2.6-2.7
-    from HTMLParser import HTMLParser
+    from orjson import loads as _loads
 except ImportError:
-    # Python 3
-    from html.parser import HTMLParser
-
-h = HTMLParser()
-API_BASE_URL='http://api.walmartlabs.com/v1/'
+    try:
+        from ujson import loads as _loads
+    except ImportError:
+        from json import loads as _loads
+try:
+    import ijson
+except ImportError:
+    ijson = None
+API_BASE_URL='https://api.walmartlabs.com/v1/'
+
+#Endpoint urls, joined once with the base url
+_EP_ITEMS = API_BASE_URL + 'items/'
+_EP_SEARCH = API_BASE_URL + 'search'
+_EP_NBP = API_BASE_URL + 'nbp'
+_EP_POSTBROWSE = API_BASE_URL + 'postbrowse'
+_EP_REVIEWS = API_BASE_URL + 'reviews/'
+_EP_TRENDS = API_BASE_URL + 'trends'
+_EP_BESTSELLERS = API_BASE_URL + 'feeds/bestsellers'
+_EP_CLEARANCE = API_BASE_URL + 'feeds/clearance'
+_EP_SPECIALBUY = API_BASE_URL + 'feeds/specialbuy'
+
+#Seconds responses are kept in the disk cache, per endpoint. Trends and special feeds are updated multiple times a day.
+_DISK_CACHE_EXPIRE_AFTER = 3600
+_DISK_CACHE_URLS_EXPIRE_AFTER = {
+    _EP_TRENDS: 300,
+    API_BASE_URL + 'feeds/': 600,
+    _EP_ITEMS: 86400,
+}
+
+#Transient gateway errors are retried with a short exponential backoff before giving up.
+#Retry-After is ignored, a maintenance 503 could otherwise block every call for hours
+_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), allowed_methods=frozenset(['GET']),
+               raise_on_status=False, respect_retry_after_header=False)
+
+#Connections kept per host by the requests session. product_lookup_bulk never runs more threads than this,
+#otherwise the extra connections would be discarded instead of going back to the pool
+_POOL_MAXSIZE = 32
+
+_OK_STATUS_CODES = frozenset((200, 201))
+_IMAGE_SIZES = frozenset(('thumbnail', 'medium', 'large'))
+
+#Error messages for the status codes documented in the Walmart API specification
+_STATUS_MESSAGES = {
+    400: 'Bad Request',
+    403: 'Forbidden',
+    404: 'Wrong endpoint',
+    414: 'Request URI too long',
+    500: 'Internal Server Error',
+    502: 'Bad Gateway',
+    503: 'Service Unavailable/ API maintenance',
+    504: 'Gateway Timeout',
+}
+
+def _is_hashable(value):
+    """Whether value can be used as a cache key
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+def _require_int(value, message):
+    """Raise an InvalidParameterException with the given message if value is not an integer. Booleans are rejected too.
+    """
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise InvalidParameterException(message)
 
 class WalmartException(Exception):
     """Base Class for Walmart Api Exceptions.
@@ -29,28 +95,11 @@ class InvalidRequestException(WalmartException):
     """
 
     def __init__(self, status_code, **kwargs):
-        error_message = 'Error'
-        if status_code == 400:
-            error_message = 'Bad Request'
-            if 'detail' in kwargs:
-                error_message = error_message + ' - ' + kwargs['detail']
-        elif status_code == 403:
-            error_message = 'Forbidden'
-        elif status_code == 404:
-            error_message = 'Wrong endpoint'
-        elif status_code == 414:
-            error_message = 'Request URI too long'
-        elif status_code == 500:
-            error_message = 'Internal Server Error'
-        elif status_code == 502:
-            error_message = 'Bad Gateway'
-        elif status_code == 503:
-            error_message = 'Service Unavailable/ API maintenance'
-        elif status_code == 504:
-            error_message = 'Gateway Timeout'
+        error_message = _STATUS_MESSAGES.get(status_code, 'Error')
+        if status_code == 400 and kwargs.get('detail'):
+            error_message = error_message + ' - ' + kwargs['detail']
         message = '[Request failed] Walmart server answered with the following error: {0:s}. Status code: {1:d}'.format(error_message, status_code)
-        super(self.__class__, self).__init__(message)
-    pass
+        super().__init__(message)
 
 class Wapy:
     """Models the main Walmart API proxy class
@@ -65,9 +114,110 @@ class Wapy:
         - Named params passed in kwargs:
             :param LinkShareID [Optional]
                 Your own LinkShare ID. It can be found in any link you generate from the LinkShare platform after the 'id=' parameter. It is an 11 digit alphanumeric string.
+
+            :param cache_ttl [Optional]
+                Number of seconds successful responses are kept in an in-memory cache and reused for identical requests.
+                The cache is on by default with a value of 60. Set it to 0 to disable the cache.
+                Cached responses are parsed again on every call, so each product gets its own payload.
+
+            :param cache_size [Optional]
+                Maximum number of responses kept in the in-memory cache. Default is 256.
+
+            :param backend [Optional]
+                HTTP library used to talk to the Walmart API, allowed values are [requests, httpx]. Default is requests.
+                The httpx backend multiplexes requests over HTTP/2 and enables the async methods. It requires httpx[http2] to be installed.
+                Neither backend sets a timeout on requests.
+
+            :param disk_cache [Optional]
+                A boolean to specify whether responses should be cached in a sqlite database (wapy_cache.sqlite) that survives restarts.
+                Trending products are cached for 5 minutes, special feeds for 10 minutes, product lookups for a day and everything else for an hour.
+                It's False by default. Requires requests-cache to be installed and is only available with the requests backend.
+
+            :param warm_up [Optional]
+                A boolean to specify whether a connection to the Walmart API should be opened right away, so DNS resolution and
+                the TLS handshake are not paid by the first request. It's False by default. Failures are ignored.
         """
-        self.params = {'apiKey':api_key,'format':'json'}
         self.LSNID = kwargs.get('LinkShareID')
+        self._cache_ttl = kwargs.get('cache_ttl', 60)
+        if self._cache_ttl:
+            self._cached_request = lru_cache(maxsize=kwargs.get('cache_size', 256))(self._request_content)
+        else:
+            self._cached_request = None
+        #apiKey and format are sent with every request, the clients merge them with the params of each call
+        params = {'apiKey':api_key,'format':'json'}
+        self._backend = kwargs.get('backend', 'requests')
+        disk_cache = kwargs.get('disk_cache', False)
+        if disk_cache and self._backend != 'requests':
+            raise InvalidParameterException('The disk cache is only available with the requests backend')
+        if self._backend == 'requests':
+            if disk_cache:
+                #requests-cache is only imported when the disk cache is on, so it is not loaded by every import of wapy
+                try:
+                    from requests_cache import CachedSession
+                except ImportError:
+                    raise ImportError('The disk cache requires requests-cache. Install it with: pip install requests-cache')
+                #CachedSession is a drop-in requests.Session. apiKey is left out of the cache keys so it is never written to disk
+                self._session = CachedSession('wapy_cache', backend='sqlite', expire_after=_DISK_CACHE_EXPIRE_AFTER,
+                                              urls_expire_after=_DISK_CACHE_URLS_EXPIRE_AFTER, allowable_methods=('GET',),
+                                              ignored_parameters=('apiKey',))
+            else:
+                #Keep a single session so the underlying connections are reused across requests
+                self._session = requests.Session()
+            self._session.params = params
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            self._async_client = None
+        elif self._backend == 'httpx':
+            #httpx is only imported when its backend is chosen, so it is not loaded by every import of wapy
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError("The httpx backend requires httpx. Install it with: pip install 'httpx[http2]'")
+            #No timeout, the same as the requests backend
+            self._session = httpx.Client(http2=True, params=params, timeout=None)
+            #The async client is only created by the first async request, so sync-only use never opens it
+            self._client_params = params
+            self._async_client = None
+        else:
+            raise InvalidParameterException("Backend should be 'requests' or 'httpx'")
+        if kwargs.get('warm_up', False):
+            self._warm_up()
+
+    def _warm_up(self):
+        """Open a connection to the Walmart API with a HEAD request and keep it in the pool. Fails silently.
+        """
+        try:
+            self._session.head(API_BASE_URL).close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """Close the underlying HTTP session (the requests session or the sync httpx client) and release its pooled connections
+
+        The async client of the httpx backend, if any async method has been called, can only be closed with aclose.
+        """
+        self._session.close()
+
+    async def aclose(self):
+        """Close both the underlying HTTP session and the async client used by the httpx backend, releasing all pooled connections
+        """
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def product_lookup(self, item_id, **kwargs):
         """Walmart product lookup
@@ -83,11 +233,56 @@ class Wapy:
             An instance of :class: `~.WalmartProduct
 
         """
-        url = API_BASE_URL + 'items/'+item_id
-        data = self._send_request(url, **kwargs).json()
+        url = _EP_ITEMS + item_id
+        data = self._send_request(url, **kwargs)
+        return WalmartProduct(data, self.LSNID)
+
+    async def product_lookup_async(self, item_id, **kwargs):
+        """Walmart product lookup, awaitable version of product_lookup. Requires the httpx backend.
+
+        Many lookups can run concurrently over a single HTTP/2 connection with asyncio.gather.
+
+        :param item_id:
+            A string representing the product item id
+
+        - Named params passed in kwargs:
+            :param richAttributes [Optional]
+                A boolean to specify whether you want to get your reponse with rich attributes or not. It's True by default.
+
+        :return:
+            An instance of :class: `~.WalmartProduct
+
+        """
+        url = _EP_ITEMS + item_id
+        data = await self._send_request_async(url, **kwargs)
         return WalmartProduct(data, self.LSNID)
 
-    def search(self, query, **kwargs):
+    def product_lookup_bulk(self, item_ids, max_workers=8, **kwargs):
+        """Walmart product lookup for several items at once
+
+        Lookups are sent concurrently over the pooled session, so looking up many items with this method
+        is much faster than calling product_lookup in a loop.
+
+        :param item_ids:
+            An iterable of strings representing the product item ids
+
+        :param max_workers:
+            Maximum number of lookups sent at the same time. Default is 8.
+            Capped at 32, the number of connections the session keeps in its pool.
+
+        - Named params passed in kwargs:
+            :param richAttributes [Optional]
+                A boolean to specify whether you want to get your reponse with rich attributes or not. It's True by default.
+
+        :return:
+            A list of :class:`~.WalmartProduct`, in the same order as item_ids.
+        """
+        max_workers = min(max_workers, _POOL_MAXSIZE)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.product_lookup, item_id, **kwargs) for item_id in item_ids]
+            return [future.result() for future in futures]
+
+    def search(self, query, stream=False, **kwargs):
         """Search allows text search on the Walmart.com catalogue and returns matching items available for sale online.
 
         This implementation doesn't take into account the start parameter from the actual Walmart specification.
@@ -97,6 +292,9 @@ class Wapy:
         :param query:
             Search text - whitespace separated sequence of keywords to search for
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         - Named params passed in kwargs:
             :param numItems [Optional]
                 Number of matching items to be returned, max value 25. Default is 10.
@@ -127,32 +325,58 @@ class Wapy:
             :param facet.range [Optional]
                 Range filter for facets which take range values, like price. See usage above in the examples.
 
+        :return:
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
+        """
+        url = _EP_SEARCH
+        kwargs = self._search_params(query, **kwargs)
+        if stream:
+            return (WalmartProduct(item, self.LSNID) for item in self._stream_request(url, 'items.item', **kwargs))
+        data = self._send_request(url, **kwargs)
+        return [WalmartProduct(item, self.LSNID) for item in data["items"]]
+
+    async def search_async(self, query, **kwargs):
+        """Search the Walmart.com catalogue, awaitable version of search. Requires the httpx backend.
+
+        :param query:
+            Search text - whitespace separated sequence of keywords to search for
+
+        - Named params passed in kwargs are the same as in search
+
         :return:
             A list of :class:`~.WalmartProduct`.
         """
-        url = API_BASE_URL + 'search'
+        url = _EP_SEARCH
+        kwargs = self._search_params(query, **kwargs)
+        data = await self._send_request_async(url, **kwargs)
+        return [WalmartProduct(item, self.LSNID) for item in data["items"]]
+
+    def _search_params(self, query, **kwargs):
+        """Validate the search arguments and translate the requested page into the start parameter of the Walmart specification
+
+        :param query:
+            Search text - whitespace separated sequence of keywords to search for
+
+        :return:
+            The GET arguments of the search request (dict)
+        """
         kwargs['query'] = query
-        if 'page' in kwargs:
-            if type(kwargs['page']) != int:
-                raise InvalidParameterException('Page should be a numeric value')
-            if 'numItems' in kwargs:
-                if type(kwargs['numItems']) != int:
-                    raise InvalidParameterException('Number of items should be a numeric value')
-                if kwargs['numItems']>25:
+        page = kwargs.pop('page', None)
+        if page is not None:
+            _require_int(page, 'Page should be a numeric value')
+            num_items = kwargs.get('numItems')
+            if num_items is not None:
+                _require_int(num_items, 'Number of items should be a numeric value')
+                if num_items>25:
                     raise InvalidParameterException('Number of items must not exceed 25')
-                kwargs['start'] = kwargs['numItems']*(kwargs['page']-1) + 1
             else:
                 #if numItems not specified, use 10 as default items per page as Walmart does too
-                kwargs['start'] = 10*(kwargs['page']-1) + 1
-        kwargs.pop('page', None)
-        data = self._send_request(url, **kwargs).json()
-        products = []
-        for item in data["items"]:
-            products.append(WalmartProduct(item, self.LSNID))
-        return products
+                num_items = 10
+            kwargs['start'] = num_items*(page-1) + 1
+        return kwargs
 
 
-    def product_recommendations(self, item_id):
+    def product_recommendations(self, item_id, stream=False):
         """Returns a list of a product's related products.
 
         A maximum of 10 items are returned, being ordered from most relevant to least relevant for the customer.
@@ -160,17 +384,19 @@ class Wapy:
         :param item_id:
             The id of the product from which the related products are returned
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'nbp'
-        data = self._send_request(url, itemId=item_id).json()
-        products = []
-        for item in data:
-            products.append(WalmartProduct(item, self.LSNID))
-        return products
+        url = _EP_NBP
+        if stream:
+            return (WalmartProduct(item, self.LSNID) for item in self._stream_request(url, 'item', itemId=item_id))
+        data = self._send_request(url, itemId=item_id)
+        return [WalmartProduct(item, self.LSNID) for item in data]
 
-    def post_browsed_products(self, item_id):
+    def post_browsed_products(self, item_id, stream=False):
         """Returns a list of recommended products based on their product viewing history.
 
         A maximum of 10 items are returned, being ordered from most relevant to least relevant for the customer.
@@ -178,48 +404,54 @@ class Wapy:
         :param item_id:
             The id of the product from which the post browsed products are returned
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'postbrowse'
-        data = self._send_request(url, itemId=item_id).json()
-        products = []
-        for item in data:
-            products.append(WalmartProduct(item, self.LSNID))
-        return products
+        url = _EP_POSTBROWSE
+        if stream:
+            return (WalmartProduct(item, self.LSNID) for item in self._stream_request(url, 'item', itemId=item_id))
+        data = self._send_request(url, itemId=item_id)
+        return [WalmartProduct(item, self.LSNID) for item in data]
 
-    def product_reviews(self, item_id):
+    def product_reviews(self, item_id, stream=False):
         """Return the list of item reviews written by Walmart users.
 
         :param item_id:
             The id of the product which reviews are returned from
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProductReview`.
+            A list of :class:`~.WalmartProductReview`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'reviews/' + item_id
-        data = self._send_request(url).json()
-        reviews = []
-        for item in data['reviews']:
-            reviews.append(WalmartProductReview(item))
-        return reviews
+        url = _EP_REVIEWS + item_id
+        if stream:
+            return (WalmartProductReview(item) for item in self._stream_request(url, 'reviews.item'))
+        data = self._send_request(url)
+        return [WalmartProductReview(item) for item in data['reviews']]
 
-    def trending_products(self):
+    def trending_products(self, stream=False):
         """Return a list of items according to what is bestselling on Walmart.com right now.
 
         The items are curated on the basis of user browse activity and sales activity, and updated multiple times a day.
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'trends'
-        data = self._send_request(url).json()
-        products = []
-        for item in data['items']:
-            products.append(WalmartProduct(item, self.LSNID))
-        return products
+        url = _EP_TRENDS
+        if stream:
+            return (WalmartProduct(item, self.LSNID) for item in self._stream_request(url, 'items.item'))
+        data = self._send_request(url)
+        return [WalmartProduct(item, self.LSNID) for item in data['items']]
 
-    def bestseller_products(self, category):
+    def bestseller_products(self, category, stream=False):
         """Return a list of bestselling items in their respective categories on Walmart.com
 
         This method is part of the Special Feeds section of the Walmart API.
@@ -227,13 +459,16 @@ class Wapy:
         :param category:
             The number id of the category from which the products are retrieved.
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'feeds/bestsellers'
-        return self._send_special_feed_request(url, category)
+        url = _EP_BESTSELLERS
+        return self._send_special_feed_request(url, category, stream)
 
-    def clearance_products(self, category):
+    def clearance_products(self, category, stream=False):
         """Return a list of all items on clearance from a category
 
         This method is part of the Special Feeds section of the Walmart API.
@@ -241,13 +476,16 @@ class Wapy:
         :param category:
             The number id of the category from which the products are retrieved.
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'feeds/clearance'
-        return self._send_special_feed_request(url, category)
+        url = _EP_CLEARANCE
+        return self._send_special_feed_request(url, category, stream)
 
-    def special_buy_products(self, category):
+    def special_buy_products(self, category, stream=False):
         """Return a list of all items on Special Buy on Walmart.com, which means there is a special offer on them
 
         This method is part of the Special Feeds section of the Walmart API.
@@ -255,30 +493,114 @@ class Wapy:
         :param category:
             The number id of the category from which the products are retrieved.
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        url = API_BASE_URL + 'feeds/specialbuy'
-        return self._send_special_feed_request(url, category)
+        url = _EP_SPECIALBUY
+        return self._send_special_feed_request(url, category, stream)
 
-    def _send_special_feed_request(self, url, category):
+    def _send_special_feed_request(self, url, category, stream=False):
         """Send a request to the Special Feeds endpoint and returns the desired list of products
 
         :param category:
             The number id of the category from which the products are retrieved.
 
+        :param stream [Optional]
+            If True, return a generator that parses the response lazily instead of a list. Default is False.
+
         :return:
-            A list of :class:`~.WalmartProduct`.
+            A list of :class:`~.WalmartProduct`, or a generator of them if stream is True.
         """
-        if type(category) != int:
-            raise InvalidParameterException('Category must be numeric. See Walmart Taxonomy API for more information.')
-        data = self._send_request(url, categoryId=category).json()
-        products = []
-        for item in data['items']:
-            products.append(WalmartProduct(item, self.LSNID))
-        return products
+        _require_int(category, 'Category must be numeric. See Walmart Taxonomy API for more information.')
+        if stream:
+            return (WalmartProduct(item, self.LSNID) for item in self._stream_request(url, 'items.item', categoryId=category))
+        data = self._send_request(url, categoryId=category)
+        return [WalmartProduct(item, self.LSNID) for item in data['items']]
 
     def _send_request(self, url, **kwargs):
+        """Sends a request to the Walmart API and return the parsed json response.
+
+        :param url:
+            The endpoint url to make the request
+
+        - Named params passed in kwargs can be any of the optional GET arguments specified in the Walmart specification
+        """
+        params = tuple(sorted(kwargs.items()))
+        if self._cached_request is None or not _is_hashable(params):
+            content = self._request_content(url, params)
+        else:
+            #Cache keys include the current time bucket, so entries stop being hit once cache_ttl seconds have passed
+            bucket = int(time.time() // self._cache_ttl)
+            content = self._cached_request(url, params, bucket)
+        #The cache keeps the raw body, so every call gets its own payload and callers can't alter each other's results
+        #Parse the raw bytes directly, skipping the charset detection done by r.json()
+        return _loads(content)
+
+    def _request_content(self, url, params, bucket=None):
+        """Sends a request to the Walmart API and return the raw body of the response, without going through the cache.
+
+        :param url:
+            The endpoint url to make the request
+
+        :param params:
+            A tuple of (name, value) pairs with the GET arguments of the request
+
+        :param bucket:
+            Time bucket of the request. Only used as part of the cache key.
+        """
+        r = self._get_response(url, **dict(params))
+        return r.content
+
+    def _stream_request(self, url, prefix, **kwargs):
+        """Sends a request to the Walmart API and lazily yields the elements found under prefix in the json response.
+
+        The response body is parsed incrementally with ijson, so elements are yielded as soon as they arrive
+        and nothing past the last consumed element is parsed. If ijson is not installed, the whole response is parsed at once.
+        Responses served from the disk cache have no raw stream to read from, so they are parsed at once too.
+        The body is read as raw bytes, never through the text decoding of the HTTP library.
+
+        :param url:
+            The endpoint url to make the request
+
+        :param prefix:
+            The ijson prefix of the elements to yield, e.g. 'items.item' for the elements of the 'items' array
+
+        - Named params passed in kwargs can be any of the optional GET arguments specified in the Walmart specification
+        """
+        r = self._get_response(url, stream=True, **kwargs)
+        try:
+            if ijson is None or getattr(r, 'from_cache', False):
+                #Disk cache hits have an empty raw stream, their body is in r.content
+                #httpx streamed responses only expose their body once read
+                data = _loads(r.read() if self._backend == 'httpx' else r.content)
+                for key in prefix.split('.')[:-1]:
+                    data = data[key]
+                for item in data:
+                    yield item
+            elif self._backend == 'httpx':
+                #Push the decoded chunks into ijson as they arrive and yield whatever elements they complete
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, prefix, use_float=True)
+                for chunk in r.iter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        yield item
+                    del items[:]
+                parser.close()
+                for item in items:
+                    yield item
+            else:
+                #Let urllib3 undo any gzip/deflate content encoding before ijson reads the body
+                r.raw.decode_content = True
+                for item in ijson.items(r.raw, prefix, use_float=True):
+                    yield item
+        finally:
+            r.close()
+
+    def _get_response(self, url, stream=False, **kwargs):
         """Sends a request to the Walmart API and return the HTTP response.
 
         Important remarks:
@@ -286,47 +608,102 @@ class Wapy:
             - Format is json by default and cannot be changed through kwargs
             - Send richAttributes='true' by default. Can be set to 'false' through kwargs
 
+        :param url:
+            The endpoint url to make the request
+
+        :param stream:
+            If True, the response body is not downloaded until it is read
+
+        - Named params passed in kwargs can be any of the optional GET arguments specified in the Walmart specification
+        """
+        if self._backend == 'httpx':
+            request = self._session.build_request('GET', url, params=self._request_params(kwargs))
+            r = self._session.send(request, stream=stream)
+            if stream and r.status_code not in _OK_STATUS_CODES:
+                #Load the error body so the error detail can be parsed
+                r.read()
+        else:
+            r = self._session.get(url, params=self._request_params(kwargs), stream=stream)
+            if stream and r.status_code not in _OK_STATUS_CODES:
+                #Read the error body so the error detail can be parsed, then release the connection back to the pool
+                r.content
+                r.close()
+        self._check_response(r)
+        return r
+
+    async def _send_request_async(self, url, **kwargs):
+        """Sends a request to the Walmart API with the async httpx client and return the parsed json response.
+
+        Responses are not cached.
+
         :param url:
             The endpoint url to make the request
 
         - Named params passed in kwargs can be any of the optional GET arguments specified in the Walmart specification
         """
+        if self._backend != 'httpx':
+            raise WalmartException("Async requests require the httpx backend. Create the Wapy instance with backend='httpx'")
+        if self._async_client is None:
+            import httpx
+            self._async_client = httpx.AsyncClient(http2=True, params=self._client_params, timeout=None)
+        r = await self._async_client.get(url, params=self._request_params(kwargs))
+        self._check_response(r)
+        return _loads(r.content)
+
+    def _request_params(self, kwargs):
+        """Build the GET arguments of a request from the arguments given by the caller
+
+        :param kwargs:
+            A dict with the GET arguments given by the caller. It is not modified.
+
+        :return:
+            The GET arguments to send (dict). apiKey and format are not included, the HTTP client adds them.
+        """
+        request_params = dict(kwargs)
         #Avoid format to be changed, always go for json
-        kwargs.pop('format', None)
-        request_params = self.params
-        for key, value in kwargs.items():
-            request_params[key] = value
+        request_params.pop('format', None)
 
         #Convert from native boolean python type to string 'true' or 'false'. This allows to set richAttributes with python boolean types
-        if 'richAttributes' in request_params and type(request_params['richAttributes'])==bool:
-            if request_params['richAttributes']:
-                request_params['richAttributes']='true'
-            else:
-                request_params['richAttributes']='false'
-        else:
-            #Even if not specified in arguments, send request with richAttributes='true' by default
-            request_params['richAttributes']='true'
-
-        r = requests.get(url, params=request_params)
-        if r.status_code == 200 or r.status_code == 201:
-            return r
-        else:
-            if r.status_code == 400:
-                #Send exception detail when it is a 400 error
-                raise InvalidRequestException(r.status_code, detail=r.json()['errors'][0]['message'])
-            else:
-                raise InvalidRequestException(r.status_code)
+        rich_attributes = request_params.get('richAttributes', True)
+        if isinstance(rich_attributes, bool):
+            rich_attributes = 'true' if rich_attributes else 'false'
+        #Even if not specified in arguments, send request with richAttributes='true' by default
+        request_params['richAttributes'] = rich_attributes
+        return request_params
+
+    def _check_response(self, r):
+        """Raise an InvalidRequestException with the appropiate code if the response's status code is different than 200 or 201
+
+        :param r:
+            The HTTP response, either from requests or from httpx
+        """
+        status_code = r.status_code
+        if status_code in _OK_STATUS_CODES:
+            return
+        if status_code == 400:
+            #Send exception detail when it is a 400 error
+            try:
+                detail = _loads(r.content)['errors'][0]['message']
+            except (ValueError, KeyError, IndexError, TypeError):
+                detail = None
+            raise InvalidRequestException(status_code, detail=detail)
+        raise InvalidRequestException(status_code)
 
 
 class WalmartProduct:
     """Models a Walmart Product as an object
+
+    Attributes are computed from the response payload on first access and cached afterwards.
     """
 
+    #cached_property stores its values in the instance __dict__, so it has to be kept in the slots
+    __slots__ = ('LSNID', 'response_handler', '__dict__')
+
     def __init__(self, payload, LSNID):
         self.LSNID = LSNID
         self.response_handler = ResponseHandler(payload)
 
-    @property
+    @cached_property
     def item_id(self):
         """Item id: A positive integer that uniquely identifies an item
 
@@ -335,7 +712,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('itemId')
 
-    @property
+    @cached_property
     def parent_item_id(self):
         """Parent Item id: Item Id of the base version for this item. This is present only if item is a variant of the base version, such as a different color or size.
 
@@ -344,7 +721,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('parentItemId')
 
-    @property
+    @cached_property
     def name(self):
         """Item name
 
@@ -353,7 +730,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute_text('name')
 
-    @property
+    @cached_property
     def msrp(self):
         """Manufacturer suggested retail price
 
@@ -362,7 +739,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('msrp')
 
-    @property
+    @cached_property
     def sale_price(self):
         """Sale price
 
@@ -371,7 +748,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute_float('salePrice')
 
-    @property
+    @cached_property
     def upc(self):
         """Unique Product Code
 
@@ -380,7 +757,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('upc')
 
-    @property
+    @cached_property
     def category_path(self):
         """Product Category path: Breadcrumb for the item. This string describes the category level hierarchy that the item falls under.
 
@@ -389,7 +766,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('categoryPath')
 
-    @property
+    @cached_property
     def category_node(self):
         """Product Category node: Category id for the category of this item. This value can be passed to APIs to pull this item's category level information.
 
@@ -398,7 +775,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('categoryNode')
 
-    @property
+    @cached_property
     def short_description(self):
         """Short description: Short description for the item
 
@@ -407,16 +784,16 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute_text('shortDescription')
 
-    @property
+    @cached_property
     def long_description(self):
         """Long description: Long description for the item.
 
         :return:
             Long description (string). Returns None if attribute is not found in the response.
         """
-        return self.response_handler._safe_get_attribute_text('shortDescription')
+        return self.response_handler._safe_get_attribute_text('longDescription')
 
-    @property
+    @cached_property
     def brand_name(self):
         """Brand name: Item's brand
 
@@ -425,7 +802,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('brandName')
 
-    @property
+    @cached_property
     def thumbnail_image(self):
         """Thumbnail image: Small size image for the item in jpeg format with dimensions 100 x 100 pixels
 
@@ -434,7 +811,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('thumbnailImage')
 
-    @property
+    @cached_property
     def medium_image(self):
         """Medium image: Medium size image for the item in jpeg format with dimensions 180 x 180 pixels
 
@@ -443,7 +820,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('mediumImage')
 
-    @property
+    @cached_property
     def large_image(self):
         """Large image: Large size image for the item in jpeg format with dimensions 450 x 450 pixels
 
@@ -452,7 +829,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('largeImage')
 
-    @property
+    @cached_property
     def images(self):
         """Large image entities: All large images for this item
 
@@ -462,7 +839,7 @@ class WalmartProduct:
         """
         return self.get_images_by_size('large')
 
-    @property
+    @cached_property
     def product_tracking_url(self):
         """Product tracking url: Deep linked URL that directly links to the product page of this item on walmart.com.
         This link uniquely identifies the affiliate sending this request via a linkshare tracking id |LSNID|.
@@ -474,10 +851,12 @@ class WalmartProduct:
         """
         if self.LSNID is None:
             raise NoLinkShareIDException('No LinkShare ID specified. When retrieving the product tracking url, you must set LinkShareID = #YOUR_ID# when creating an instance of the API')
-        else:
-            return self.response_handler._safe_get_attribute('productTrackingUrl').replace('|LSNID|',self.LSNID)
+        tracking_url = self.response_handler._safe_get_attribute('productTrackingUrl')
+        if tracking_url is not None:
+            return tracking_url.replace('|LSNID|',self.LSNID)
+        return None
 
-    @property
+    @cached_property
     def size(self):
         """Size attribute for the item
 
@@ -486,7 +865,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('size')
 
-    @property
+    @cached_property
     def color(self):
         """Color attribute for the item
 
@@ -495,7 +874,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('color')
 
-    @property
+    @cached_property
     def model_number(self):
         """Model number: Model number attribute for the item
 
@@ -504,7 +883,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('modelNumber')
 
-    @property
+    @cached_property
     def product_url(self):
         """Product url: Walmart.com url for the item
 
@@ -513,7 +892,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('productUrl')
 
-    @property
+    @cached_property
     def available_online(self):
         """Available online: Whether the item is currently available for sale on Walmart.com
 
@@ -522,7 +901,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('availableOnline')
 
-    @property
+    @cached_property
     def stock(self):
         """Stock: Indicative quantity of the item available online.
 
@@ -535,7 +914,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute('stock')
 
-    @property
+    @cached_property
     def customer_rating(self):
         """Customer rating: Average customer rating out of 5
 
@@ -544,7 +923,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute_float('customerRating')
 
-    @property
+    @cached_property
     def num_reviews(self):
         """Number of customer reviews available on this item on Walmart.com
 
@@ -553,7 +932,7 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute_int('numReviews')
 
-    @property
+    @cached_property
     def weight(self):
         """Weight: Indicates the weight of the item
 
@@ -562,7 +941,19 @@ class WalmartProduct:
         """
         return self.response_handler._safe_get_attribute_float('weight')
 
-    @property
+    @cached_property
+    def _dimensions(self):
+        """Dimensions of the item parsed once from attribute dimensions, shared by length, width and height
+
+        :return:
+            A (length, width, height) tuple of floats. Returns None if attribute is not found in the response.
+        """
+        dimensions = self.response_handler._safe_get_attribute('dimensions')
+        if dimensions is not None:
+            return tuple(float(dimension) for dimension in dimensions.split('x'))
+        return None
+
+    @cached_property
     def length(self):
         """Length: Indicates the length of the item. First dimension returned by attribute dimensions
                    e.g. dimensions: "2.0 x 3.0 x 4.0" would return 2.0 as length
@@ -570,33 +961,30 @@ class WalmartProduct:
         :return:
             Length (float). Returns None if attribute is not found in the response.
         """
-        dimensions = self.response_handler._safe_get_attribute('dimensions')
-        if dimensions is not None:
-            return float(dimensions.split('x')[0])
+        if self._dimensions is not None:
+            return self._dimensions[0]
         return None
 
-    @property
+    @cached_property
     def width(self):
         """Width: Indicates the width of the item. Second dimension returned by attribute dimensions
                   e.g. dimensions: "2.0 x 3.0 x 4.0" would return 3.0 as width
         :return:
             Width (float). Returns None if attribute is not found in the response.
         """
-        dimensions = self.response_handler._safe_get_attribute('dimensions')
-        if dimensions is not None:
-            return float(dimensions.split('x')[1])
+        if self._dimensions is not None:
+            return self._dimensions[1]
         return None
 
-    @property
+    @cached_property
     def height(self):
         """Height: Indicates the height of the item. Third dimension returned by attribute dimensions
                   e.g. dimensions: "2.0 x 3.0 x 4.0" would return 4.0 as height
         :return:
             Height (float). Returns None if attribute is not found in the response.
         """
-        dimensions = self.response_handler._safe_get_attribute('dimensions')
-        if dimensions is not None:
-            return float(dimensions.split('x')[2])
+        if self._dimensions is not None:
+            return self._dimensions[2]
         return None
 
     def get_attribute(self, name):
@@ -621,31 +1009,36 @@ class WalmartProduct:
             A list with all the images URLs.
             Primary image is always returned in the first position of the list
         """
-        if size != 'thumbnail' and size != 'medium' and size != 'large':
+        if size not in _IMAGE_SIZES:
             raise InvalidParameterException("The image size should be 'thumbnail', 'medium' or 'large'")
-        images = []
-        primary_image = None
         imageEntities = self.response_handler._safe_get_attribute('imageEntities')
         if imageEntities:
+            key = size + 'Image'
+            primary_image = None
+            images = []
             for image in imageEntities:
                 if image['entityType'] != 'PRIMARY':
-                    images.append(image[size+'Image'])
+                    images.append(image[key])
                 else:
-                    primary_image = image[size+'Image']
+                    primary_image = image[key]
             if primary_image:
-                images.insert(0, primary_image)
+                return [primary_image] + images
             return images
         else:
             return None
 
 class WalmartProductReview:
     """Models a Walmart Product review as an object
+
+    Attributes are computed from the response payload on first access and cached afterwards.
     """
 
+    __slots__ = ('response_handler', '__dict__')
+
     def __init__(self, payload):
         self.response_handler = ResponseHandler(payload)
 
-    @property
+    @cached_property
     def reviewer(self):
         """Product reviewer
 
@@ -654,7 +1047,7 @@ class WalmartProductReview:
         """
         return self.response_handler._safe_get_attribute('reviewer')
 
-    @property
+    @cached_property
     def review(self):
         """Product review
 
@@ -663,7 +1056,7 @@ class WalmartProductReview:
         """
         return self.response_handler._safe_get_attribute_text('reviewText')
 
-    @property
+    @cached_property
     def date(self):
         """Product review date
 
@@ -672,7 +1065,7 @@ class WalmartProductReview:
         """
         return self.response_handler._safe_get_attribute_text('submissionTime')
 
-    @property
+    @cached_property
     def title(self):
         """Product review title
 
@@ -681,7 +1074,7 @@ class WalmartProductReview:
         """
         return self.response_handler._safe_get_attribute_text('title')
 
-    @property
+    @cached_property
     def up_votes(self):
         """Product review up votes
 
@@ -690,7 +1083,7 @@ class WalmartProductReview:
         """
         return self.response_handler._safe_get_attribute_int('upVotes')
 
-    @property
+    @cached_property
     def down_votes(self):
         """Product review down votes
 
@@ -699,7 +1092,7 @@ class WalmartProductReview:
         """
         return self.response_handler._safe_get_attribute_int('downVotes')
 
-    @property
+    @cached_property
     def rating(self):
         """Overall review rating
 
@@ -715,6 +1108,8 @@ class ResponseHandler:
     """Gets a json payload and exposes some attributes to safely get attributes from it
     """
 
+    __slots__ = ('payload',)
+
     def __init__(self, payload):
         self.payload = payload
 
@@ -744,7 +1139,7 @@ class ResponseHandler:
         """
         if attr in self.payload:
             # some strings contains escaped html formatting tags.
-            return h.unescape(self.payload[attr])
+            return _html_unescape(self.payload[attr])
         else:
             return None
 
@@ -775,3 +1170,46 @@ class ResponseHandler:
             return int(self.payload[attr])
         else:
             return None
+
+def products_to_dict(products, fields=('itemId', 'name', 'salePrice', 'msrp', 'customerRating', 'numReviews')):
+    """Extract the same attributes from many products at once, as columns
+
+    Values are read straight from each product's payload, so they are returned as sent by Walmart, the same way get_attribute does
+    (e.g. no html unescaping, numbers not parsed). Missing attributes are returned as None.
+
+    :param products:
+        An iterable of :class:`~.WalmartProduct`
+
+    :param fields:
+        Names of the product attributes to extract. See docs to see the allowed names
+
+    :return:
+        A dict mapping every field name to the list of its values, in the same order as products
+    """
+    columns = {field: [] for field in fields}
+    for product in products:
+        payload = product.response_handler.payload
+        for field in fields:
+            columns[field].append(payload.get(field))
+    return columns
+
+def products_to_dataframe(products, fields=('itemId', 'name', 'salePrice', 'msrp', 'customerRating', 'numReviews')):
+    """Extract the same attributes from many products at once, as a pandas DataFrame with one row per product
+
+    Requires pandas to be installed. See products_to_dict for how values are extracted.
+
+    :param products:
+        An iterable of :class:`~.WalmartProduct`
+
+    :param fields:
+        Names of the product attributes to extract, used as the DataFrame columns
+
+    :return:
+        A pandas DataFrame
+    """
+    #pandas is only imported when needed, it's too heavy to load with wapy
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError('products_to_dataframe requires pandas. Install it with: pip install pandas')
+    return pandas.DataFrame(products_to_dict(products, fields), columns=list(fields))